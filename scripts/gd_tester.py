@@ -65,6 +65,17 @@ class TestDirectoryManager:
 class ArgumentParserBuilder:
     """Builds and configures command line argument parser."""
     
+    @staticmethod
+    def _job_count(value: str) -> int:
+        """Parse the --jobs value: a non-negative integer, 0 meaning one per CPU."""
+        try:
+            jobs = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+        if jobs < 0:
+            raise argparse.ArgumentTypeError(f"must be 0 or more, got {jobs}")
+        return jobs
+    
     @staticmethod
     def create_argument_parser() -> argparse.ArgumentParser:
         """Create and configure the command line argument parser."""
@@ -81,6 +92,7 @@ class ArgumentParserBuilder:
                    "  %(prog)s --dry-run                         # Show what would be copied (no tests run)\n"
                    "  %(prog)s --geo /path/to/geodelity           # Specify GEODELITY_DIR for test execution\n"
                    "  %(prog)s --debug --keepjob --verbose       # Run with debug logging, keep job files, and verbose output\n"
+                   "  %(prog)s --jobs 4                          # Run up to 4 tests at the same time\n"
                    "\n"
                    "The tool always executes in this order: 1) Copy test files, 2) Run tests",
             formatter_class=argparse.RawDescriptionHelpFormatter
@@ -133,6 +145,15 @@ class ArgumentParserBuilder:
             help='Keep job files after test execution (sets KEEPJOBFILES=true)'
         )
         
+        parser.add_argument(
+            '--jobs', '-j',
+            type=ArgumentParserBuilder._job_count,
+            default=1,
+            metavar='N',
+            help='Number of tests to run in parallel (default: 1, 0 = one per CPU). '
+                 'Only use more than 1 when the tests do not share output files in the grun workspace'
+        )
+        
         return parser
 
 
@@ -199,7 +220,7 @@ class TestRunnerMode:
             self._print_run_config(geodelity_dir, args)
         
         # Create test runner and run tests
-        runner = TestRunner(geodelity_dir, args.debug, args.keepjob)
+        runner = TestRunner(geodelity_dir, args.debug, args.keepjob, args.jobs)
         results = runner.run_all_tests(self.directory_manager.tests_dir, args.verbose)
         
         if not results:
@@ -207,10 +228,11 @@ class TestRunnerMode:
             sys.exit(1)
         
         # Print test summary
-        runner.output_formatter.print_test_summary(results, args.verbose)
+        runner.output_formatter.print_test_summary(
+            results, args.verbose, runner.success_count, runner.runtime_total)
         
         # Exit with error code if any tests failed
-        failed_count = sum(1 for r in results if not r.success)
+        failed_count = len(results) - runner.success_count
         if failed_count > 0:
             sys.exit(1)
     
@@ -233,6 +255,7 @@ class TestRunnerMode:
         print(f"📂 Tests directory: {self.directory_manager.tests_dir}")
         print(f"🐛 Debug mode: {'enabled' if args.debug else 'disabled'}")
         print(f"📁 Keep job files: {'enabled' if args.keepjob else 'disabled'}")
+        print(f"⚙️  Parallel jobs: {args.jobs if args.jobs != 0 else 'one per CPU'}")
         print()
 
 
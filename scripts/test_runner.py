@@ -1,17 +1,139 @@
 #!/usr/bin/env python3
 
+import errno
+import io
 import json
 import os
 import re
 import shlex
 import subprocess
 import sys
+import threading
 import time
 import yaml
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, replace
 from enum import Enum
+from functools import cached_property, lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    # Optional: matches many substring log patterns in a single pass
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Scripts expected under GEODELITY_DIR
+ENV_SCRIPT = "etc/env.sh"
+GRUN_SCRIPT = "bin/grun.sh"
+
+# Variables set by the shell that sources env.sh rather than by env.sh itself
+SHELL_STATE_VARS = ('PWD', 'OLDPWD', 'SHLVL', '_')
+
+# Fast-path scanner for the job file schema: a top-level sequence of
+# single-key mappings whose body carries a 'version' (or 'ver') field.
+_FAST_MODULE_RE = re.compile(r'^-[ \t]+([A-Za-z_][\w\-.]*)[ \t]*:(?:[ \t]+(?:#.*)?)?$', re.MULTILINE)
+_KEY_LINE_RE = re.compile(r'([A-Za-z_][\w\-.]*)[ \t]*:(?:[ \t]+(.*?))?[ \t]*$', re.MULTILINE)
+_TOP_LEVEL_ITEM_RE = re.compile(r'^-', re.MULTILINE)
+_BODY_LINE_RE = re.compile(r'^([ \t]*)[^\s#]', re.MULTILINE)
+
+# libyaml-backed loader when PyYAML was built with it, the pure Python one otherwise
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+# Resolver the loaders use to type plain scalars (e.g. 1.10 is a float, yes a bool)
+_YAML_RESOLVER = yaml.resolver.Resolver()
+# Constructor the safe loaders build those scalars with
+_YAML_CONSTRUCTOR = yaml.constructor.SafeConstructor()
+
+# Tokenizer for JavaScript-style job configs such as {pass: no, timeout: 300}
+_CONFIG_TOKEN_RE = re.compile(
+    r'(?P<string>"(?:\\.|[^"\\])*")'
+    r'|(?P<bracket>[\[\]])'
+    r'|(?P<word>(?P<name>\w+)(?P<colon>:)?)'
+    r'|(?P<space>\s+)'
+    r'|(?P<other>[^\w"\[\]\s]+|")'
+)
+_CONFIG_VALUE_END_RE = re.compile(r'\s*[,}]')
+# Object whose first key is unquoted, which rules out plain JSON
+_UNQUOTED_KEY_RE = re.compile(r'\s*\{\s*[^\s"}]')
+# Lower-cased 'pass' values that expect the test to pass
+_PASS_WORDS = frozenset(('yes', 'true'))
+
+# Job setup echo filtering. Lines are classified by their first non-blank character:
+# blank lines and lines starting with '=' or '-' are always kept, a "Job file: .../tests/..."
+# or "Job Setup" line opens a setup block, and inside a block indented "key: value"
+# lines and '#' comments are dropped until any other line closes it.
+_NOT_KEPT_LINE = r'(?=[^\S\n]*[^\s=\-])'
+_SETUP_TRIGGER_LINE = r'(?:[^\n]*Job Setup|(?=[^\n]*/tests/)[^\n]*Job file:)[^\n]*'
+_KEPT_LINE = r'[^\S\n]*(?:[=\-][^\n]*)?\n'
+_SETUP_BLOCK_RE = re.compile(
+    r'^' + _NOT_KEPT_LINE + _SETUP_TRIGGER_LINE + r'(?:\n|\Z)'
+    r'(?:' + _KEPT_LINE +
+    r'|' + _NOT_KEPT_LINE + r'(?: [^\n:]*:[^\n]*|[^\S\n]*#[^\n]*|' + _SETUP_TRIGGER_LINE + r')(?:\n|\Z))*',
+    re.MULTILINE
+)
+_KEPT_LINE_RE = re.compile(r'^' + _KEPT_LINE, re.MULTILINE)
+
+# Patterns to match different types of error logs:
+ERROR_LOG_PATTERNS = (
+    # Pattern 1: HH:MM:SS.microseconds [pid] ERROR message
+    r'\d{2}:\d{2}:\d{2}\.\d+\s+\[\d+\]\s+(ERROR|FATAL|CRITICAL)\s+.*',
+    # Pattern 2: More flexible timestamp with ERROR/FATAL/CRITICAL
+    r'\d{2}:\d{2}:\d{2}[.\d]*\s*\[?\d*\]?\s*(ERROR|FATAL|CRITICAL)\s+.*',
+    # Pattern 3: Simple ERROR/FATAL/CRITICAL at beginning of line
+    r'^(ERROR|FATAL|CRITICAL):\s+.*',
+    # Pattern 4: Lines containing "Error:" or "error:"
+    r'.*[Ee]rror:\s+.*',
+    # Pattern 5: Exception traces
+    r'.*(Exception|Error)\s*:.*',
+    # Pattern 6: Failed/failure messages
+    r'.*(Failed|failed|FAILED)\s+.*',
+)
+
+
+def _search_form(pattern: str) -> str:
+    """
+    Drop the leading and trailing '.*' of a pattern that is only used with search()
+    
+    On a single line search() finds '.*X.*' exactly where it finds 'X', but the
+    leading '.*' makes the engine rescan the rest of the line from every start
+    position. Case is kept as written: re.IGNORECASE would widen what counts as
+    an error line (e.g. '[Ee]rror:' would start matching 'ERROR:').
+    """
+    if pattern.startswith('.*'):
+        pattern = pattern[2:]
+    if pattern.endswith('.*') and not pattern.endswith('\\.*'):
+        pattern = pattern[:-2]
+    return pattern
+
+
+# All error patterns as one alternation, so each line is scanned once instead of once per pattern.
+# Pattern 1 is left out: every line it matches is matched by pattern 2 as well. The order
+# (literal-led patterns first, the anchored and timestamp ones last) only affects speed,
+# since a line is reported whichever alternative matches.
+_ERROR_LOG_SEARCH_ORDER = (4, 5, 3, 2, 1)  # Indexes of patterns 5, 6, 4, 3 and 2
+_ERROR_LOG_RE = re.compile("|".join(f"(?:{_search_form(ERROR_LOG_PATTERNS[index])})"
+                                    for index in _ERROR_LOG_SEARCH_ORDER))
+# Every error pattern requires one of these words, so only lines containing one can match
+_ERROR_HINT_WORDS = ('ERROR', 'FATAL', 'CRITICAL', 'rror', 'Exception', 'ailed', 'FAILED')
+_ERROR_HINT_RE = re.compile('|'.join(_ERROR_HINT_WORDS))
+
+# Row of the ALL TEST RESULTS summary section
+_RESULT_LINE_TEMPLATE = "  %s %s: %s - %s (%.1fs)%s\n"
+
+# Fixed headers of the formatted output, built once at import time
+_SEPARATOR = "=" * 60
+_SUMMARY_HEADER = "\n" + _SEPARATOR + "\nTEST SUMMARY\n" + _SEPARATOR + "\n"
+_MODULES_PREFIX = "  📦 Modules: "
+_ERROR_LOGS_HEADER = "  🚨 Error Logs:\n"
+_ERROR_BANNER = "\n🚨 ERROR LOGS FROM FAILED TESTS ("
+_STDOUT_HEADER = "  📤 Stdout:\n"
+_STDERR_HEADER = "  📥 Stderr:\n"
 
 
 class TestStatus(Enum):
@@ -21,30 +143,25 @@ class TestStatus(Enum):
     ERROR = "ERROR"
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ModuleInfo:
     name: str
     version: str
+    
+    @classmethod
+    def interned(cls, name: str, version: str) -> 'ModuleInfo':
+        """Create a ModuleInfo whose strings are shared with every other job using the module"""
+        return cls(sys.intern(name), sys.intern(version))
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LogMatchResult:
     """Result containing detailed information about log matching"""
-    patterns: List[str]  # List of patterns to match
+    patterns: Sequence[str]  # Patterns to match (shared with the job config, never modified)
     matched_patterns: List[str]  # Successfully matched patterns
     unmatched_patterns: List[str]  # Unmatched patterns
     match_details: Dict[str, List[str]]  # Specific log lines matched by each pattern
     
-    def __post_init__(self):
-        if self.patterns is None:
-            self.patterns = []
-        if self.matched_patterns is None:
-            self.matched_patterns = []
-        if self.unmatched_patterns is None:
-            self.unmatched_patterns = []
-        if self.match_details is None:
-            self.match_details = {}
-    
     @property
     def all_matched(self) -> bool:
         """Returns whether all patterns were matched successfully"""
@@ -54,26 +171,40 @@ class LogMatchResult:
     def has_patterns(self) -> bool:
         """Returns whether there are patterns to match"""
         return len(self.patterns) > 0
+    
+    @classmethod
+    def empty_for(cls, patterns: Optional[Sequence[str]] = None) -> 'LogMatchResult':
+        """Returns a result in which no pattern has been matched (shared instance if no patterns)"""
+        if not patterns:
+            return cls._EMPTY
+        return cls(
+            patterns=patterns,
+            matched_patterns=[],
+            unmatched_patterns=list(patterns),
+            match_details={pattern: [] for pattern in patterns}
+        )
 
-@dataclass
+
+LogMatchResult._EMPTY = LogMatchResult(patterns=(), matched_patterns=[], unmatched_patterns=[], match_details={})
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class JobConfig:
     pass_expected: bool = True
     timeout: int = 300
-    log_patterns: List[str] = None  # Log matching patterns
-    modules: List[ModuleInfo] = None
-    
-    def __post_init__(self):
-        if self.modules is None:
-            self.modules = []
-        if self.log_patterns is None:
-            self.log_patterns = []
+    log_patterns: Tuple[str, ...] = ()  # Log matching patterns, immutable so results can share them
+    modules: List[ModuleInfo] = field(default_factory=list)
 
     @classmethod
     def from_string(cls, config_str: str) -> 'JobConfig':
+        # Unquoted keys as in {pass: no, timeout: 300} are never valid JSON, so such
+        # configs skip the direct attempt rather than raise and catch a decode error
+        is_json = not _UNQUOTED_KEY_RE.match(config_str)
         try:
             # First try direct JSON parsing
-            config_dict = json.loads(config_str)
+            config_dict = json.loads(config_str) if is_json else None
         except (json.JSONDecodeError, ValueError, TypeError):
+            is_json = False
+        if not is_json:
             try:
                 # Try to convert JavaScript-style object to JSON
                 # Handle formats like {pass: no, timeout: 300}
@@ -100,53 +231,120 @@ class JobConfig:
         # Handle pass parameter case sensitivity
         pass_value = config_dict.get('pass', 'yes')
         if isinstance(pass_value, str):
-            pass_expected = pass_value.lower() in ['yes', 'true']
+            pass_expected = pass_value.lower() in _PASS_WORDS
         else:
             pass_expected = bool(pass_value)
         
         return cls(
             pass_expected=pass_expected,
             timeout=int(config_dict.get('timeout', 300)),
-            log_patterns=log_patterns
+            log_patterns=tuple(log_patterns)
         )
     
     @classmethod
     def _normalize_config_string(cls, config_str: str) -> str:
         """Convert JavaScript-style object notation to valid JSON."""
-        import re
-        
-        # Remove leading/trailing whitespace
-        config_str = config_str.strip()
-        
-        # More careful approach: only match keys at the object level, not inside arrays
-        # First, temporarily replace array contents to protect them
-        array_contents = {}
-        array_counter = 0
-        
-        def replace_array(match):
-            nonlocal array_counter
-            placeholder = f"__ARRAY_{array_counter}__"
-            array_contents[placeholder] = match.group(0)
-            array_counter += 1
-            return placeholder
-        
-        # Protect array contents from key replacement
-        config_str = re.sub(r'\[[^\[\]]*\]', replace_array, config_str)
-        
-        # Now safely add quotes around unquoted keys
-        config_str = re.sub(r'(\w+):', r'"\1":', config_str)
-        
-        # Handle common JavaScript values that need quotes
-        config_str = re.sub(r':\s*(yes|no)(?=\s*[,}])', r': "\1"', config_str)
-        
-        # Replace unquoted 'true'/'false' with lowercase
-        config_str = re.sub(r':\s*(True|False)(?=\s*[,}])', lambda m: f': {m.group(1).lower()}', config_str)
-        
-        # Restore array contents
-        for placeholder, original in array_contents.items():
-            config_str = config_str.replace(placeholder, original)
+        normalized = []
+        depth = 0
+        after_colon = False
+        
+        # Single pass over tokens, tracking bracket depth so that array
+        # contents (at any nesting level) are copied verbatim
+        for token in _CONFIG_TOKEN_RE.finditer(config_str.strip()):
+            text = token.group(0)
+            
+            if token.lastgroup == 'bracket':
+                depth += 1 if text == '[' else -1 if depth else 0
+            elif token.lastgroup == 'word' and depth == 0:
+                if token.group('colon'):
+                    # Add quotes around unquoted keys
+                    text = f'"{token.group("name")}":'
+                elif after_colon and _CONFIG_VALUE_END_RE.match(token.string, token.end()):
+                    # Handle common JavaScript values that need quotes or lowercase
+                    if text in ('yes', 'no'):
+                        text = f'"{text}"'
+                    elif text in ('True', 'False'):
+                        text = text.lower()
+            
+            if token.lastgroup != 'space':
+                after_colon = text.endswith(':')
+            normalized.append(text)
         
-        return config_str
+        return ''.join(normalized)
+
+
+@lru_cache(maxsize=512)
+def _line_matcher_cached(pattern: str) -> Callable[[str], bool]:
+    """Build the line predicate for pattern; jobs sharing a pattern compile it only once."""
+    if pattern.startswith('^'):
+        # Regular expression matching
+        try:
+            return re.compile(pattern).search
+        except re.error:
+            # If regex is invalid, fallback to string matching
+            pattern = pattern[1:]  # Remove leading ^
+    
+    # String matching
+    return lambda line: pattern in line
+
+
+@lru_cache(maxsize=512)
+def _plain_substring(pattern: str) -> Optional[str]:
+    """The text pattern is matched as a plain substring, or None for a working regex."""
+    if pattern.startswith('^'):
+        try:
+            re.compile(pattern)
+            return None
+        except re.error:
+            return pattern[1:]  # Same substring fallback as the line matcher
+    return pattern
+
+
+@lru_cache(maxsize=256)
+def _pattern_plan(patterns: Tuple[str, ...]) -> Tuple[Tuple[str, Optional[str], Callable[[str], bool]], ...]:
+    """
+    Prepare a job's pattern list once per distinct list: every unique pattern with
+    its plain substring (None for a working regex) and its line predicate
+    """
+    return tuple((pattern, _plain_substring(pattern), _line_matcher_cached(pattern))
+                 for pattern in dict.fromkeys(patterns))
+
+
+@lru_cache(maxsize=64)
+def _substring_automaton(substrings: Tuple[str, ...]):
+    """Aho-Corasick automaton reporting each substring found, built once per pattern set."""
+    automaton = ahocorasick.Automaton()
+    for substring in substrings:
+        automaton.add_word(substring, substring)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=128)
+def _line_prefilter_cached(patterns: Tuple[str, ...]) -> Optional[Callable[[str], object]]:
+    """
+    Combine all patterns into one alternation that rejects lines none of them can match
+    
+    Returns None when the patterns cannot be combined safely: capture groups
+    would be renumbered inside the alternation (breaking back references) and
+    inline global flags are only allowed at the start of a regex.
+    """
+    alternatives = []
+    for pattern in patterns:
+        if pattern.startswith('^'):
+            try:
+                if re.compile(pattern).groups:
+                    return None
+                alternatives.append(f'(?:{pattern})')
+                continue
+            except re.error:
+                pattern = pattern[1:]  # Same substring fallback as the line matcher
+        alternatives.append(re.escape(pattern))
+    
+    try:
+        return re.compile('|'.join(alternatives)).search
+    except re.error:
+        return None
 
 
 class LogPatternMatcher:
@@ -155,98 +353,43 @@ class LogPatternMatcher:
     def __init__(self):
         pass
     
-    def _is_regex_pattern(self, pattern: str) -> bool:
-        """Determines if pattern is a regular expression (starts with ^)"""
-        return pattern.startswith('^')
-    
-    def _match_pattern(self, pattern: str, log_text: str) -> List[str]:
-        """
-        Match a single pattern and return matching log lines
-        
-        Args:
-            pattern: Pattern to match
-            log_text: Log text to search
-            
-        Returns:
-            List of matched log lines
-        """
-        matched_lines = []
-        
-        if not log_text:
-            return matched_lines
-            
-        lines = log_text.split('\n')
-        
-        if self._is_regex_pattern(pattern):
-            # Regular expression matching
-            try:
-                regex_pattern = re.compile(pattern)
-                for line in lines:
-                    line_stripped = line.strip()
-                    if line_stripped and regex_pattern.search(line_stripped):
-                        matched_lines.append(line_stripped)
-            except re.error:
-                # If regex is invalid, fallback to string matching
-                pattern_cleaned = pattern[1:]  # Remove leading ^
-                for line in lines:
-                    line_stripped = line.strip()
-                    if line_stripped and pattern_cleaned in line_stripped:
-                        matched_lines.append(line_stripped)
-        else:
-            # String matching
-            for line in lines:
-                line_stripped = line.strip()
-                if line_stripped and pattern in line_stripped:
-                    matched_lines.append(line_stripped)
-        
-        return matched_lines
-    
     def _filter_job_setup_content(self, output: str) -> str:
         """
         Filter out job config file echoes while preserving program execution output
         Strategy: Only filter lines that are clearly configuration file content
         """
-        lines = output.split('\n')
-        filtered_lines = []
-        
-        # More conservative strategy: only skip clear config file display sections
-        skip_line = False
-        
-        for line in lines:
-            stripped = line.strip()
-            
-            # Skip empty lines and separators
-            if not stripped or stripped.startswith('=') or stripped.startswith('-'):
-                filtered_lines.append(line)
-                continue
-                
-            # Skip Job file line and Job Setup title
-            if ('Job file:' in line and '/tests/' in line) or 'Job Setup' in line:
-                skip_line = True
+        if 'Job' not in output:
+            return output
+        # Each setup block is matched in one pass; only its separator and blank lines survive
+        return _SETUP_BLOCK_RE.sub(lambda block: ''.join(_KEPT_LINE_RE.findall(block.group())), output)
+
+    @staticmethod
+    def _collect_substring_matches(log_text: str, patterns: List[str],
+                                   match_details: Dict[str, List[str]]) -> None:
+        """Add every line containing each substring pattern, using one Aho-Corasick pass"""
+        patterns_by_substring: Dict[str, List[str]] = {}
+        for pattern in patterns:
+            patterns_by_substring.setdefault(_plain_substring(pattern), []).append(pattern)
+        
+        last_line_start: Dict[str, int] = {}
+        automaton = _substring_automaton(tuple(patterns_by_substring))
+        for end_index, substring in automaton.iter(log_text):
+            start = log_text.rfind('\n', 0, end_index - len(substring) + 1) + 1
+            # A line is recorded once per pattern, however often the substring occurs in it
+            if last_line_start.get(substring) == start:
                 continue
-                
-            # Detect YAML config lines (starting with - or indented key-value pairs)
-            if skip_line:
-                # If it's a YAML format line, skip it
-                if (stripped.startswith('-') and ':' in stripped) or \
-                   (line.startswith(' ') and ':' in stripped) or \
-                   stripped.startswith('#'):
-                    continue
-                # Encountered separator, stop skipping
-                elif stripped.startswith('-------'):
-                    skip_line = False
-                    continue
-                # Other lines (like timestamps, build output, etc.) are preserved
-                else:
-                    skip_line = False
-                    filtered_lines.append(line)
-            else:
-                # Normally preserve all lines
-                filtered_lines.append(line)
-        
-        return '\n'.join(filtered_lines)
+            last_line_start[substring] = start
+            
+            end = log_text.find('\n', end_index)
+            if end < 0:
+                end = len(log_text)
+            line_stripped = log_text[start:end].strip()
+            # The hit may lie in whitespace stripped off the line
+            if substring in line_stripped:
+                for pattern in patterns_by_substring[substring]:
+                    match_details[pattern].append(line_stripped)
 
-    def match_patterns(self, patterns: List[str], stdout: str, stderr: str) -> LogMatchResult:
+    def match_patterns(self, patterns: Sequence[str], stdout: str, stderr: str) -> LogMatchResult:
         """
         Match all patterns
         
@@ -259,36 +402,56 @@ class LogPatternMatcher:
             LogMatchResult containing detailed match results
         """
         if not patterns:
-            return LogMatchResult(
-                patterns=[],
-                matched_patterns=[],
-                unmatched_patterns=[],
-                match_details={}
-            )
-        
-        # Use improved filter
-        filtered_stdout = self._filter_job_setup_content(stdout)
-        filtered_stderr = self._filter_job_setup_content(stderr)
+            return LogMatchResult.empty_for()
+        
+        # Use improved filter; stdout and stderr are then processed one after the
+        # other rather than copied into a combined log
+        logs = (self._filter_job_setup_content(stdout), self._filter_job_setup_content(stderr))
+        
+        match_details = {pattern: [] for pattern in patterns}
+        active = []
+        automaton_patterns = []
+        # Jobs sharing a pattern list share its prepared plan
+        for pattern, substring, matches in _pattern_plan(tuple(patterns)):
+            if substring is not None:
+                # A substring missing from the whole log cannot be in any of its lines
+                if not any(substring in log for log in logs):
+                    continue
+                # Substrings spanning a line break can never match, leave them to the line loop
+                if ahocorasick is not None and substring and '\n' not in substring:
+                    automaton_patterns.append((pattern, matches))
+                    continue
+            active.append((pattern, matches))
         
-        # Combine filtered output
-        combined_log = f"{filtered_stdout}\n{filtered_stderr}"
+        if len(automaton_patterns) > 1:
+            for log in logs:
+                self._collect_substring_matches(log, [pattern for pattern, _ in automaton_patterns],
+                                                match_details)
+        else:
+            active.extend(automaton_patterns)
         
-        matched_patterns = []
-        unmatched_patterns = []
-        match_details = {}
+        # With several patterns, one combined search skips lines that match none of them
+        prefilter = _line_prefilter_cached(tuple(pattern for pattern, _ in active)) if len(active) > 1 else None
         
-        for pattern in patterns:
-            matched_lines = self._match_pattern(pattern, combined_log)
+        # Scan the log once, testing every remaining pattern on each line;
+        # stderr is only split if the scan gets that far
+        lines = chain.from_iterable(log.split('\n') for log in logs) if active else ()
+        for line in lines:
+            line_stripped = line.strip()
+            if not line_stripped:
+                continue
+            if prefilter is not None and not prefilter(line_stripped):
+                continue
             
-            if matched_lines:
-                matched_patterns.append(pattern)
-                match_details[pattern] = matched_lines
-            else:
-                unmatched_patterns.append(pattern)
-                match_details[pattern] = []
+            for pattern, matches in active:
+                if matches(line_stripped):
+                    match_details[pattern].append(line_stripped)
+        
+        matched_patterns = [pattern for pattern in patterns if match_details[pattern]]
+        unmatched_patterns = [pattern for pattern in patterns if not match_details[pattern]]
         
         return LogMatchResult(
-            patterns=patterns.copy(),
+            patterns=tuple(patterns),  # No copy when given the config's tuple
             matched_patterns=matched_patterns,
             unmatched_patterns=unmatched_patterns,
             match_details=match_details
@@ -302,41 +465,42 @@ class TestResult:
     expected_pass: bool
     runtime: float
     timeout_limit: int
-    modules: List[ModuleInfo] = None
+    modules: List[ModuleInfo] = field(default_factory=list)
     stdout: str = ""
     stderr: str = ""
     error_msg: str = ""
-    log_match_result: LogMatchResult = None  # Log matching result
-    
-    def __post_init__(self):
-        if self.modules is None:
-            self.modules = []
-        if self.log_match_result is None:
-            self.log_match_result = LogMatchResult(
-                patterns=[],
-                matched_patterns=[],
-                unmatched_patterns=[],
-                match_details={}
-            )
+    log_match_result: LogMatchResult = field(default_factory=LogMatchResult.empty_for)  # Log matching result
 
-    @property
+    @cached_property
     def success(self) -> bool:
+        """Whether the test behaved as expected; results are not modified once built, so it is computed once"""
         # Part 1: Basic test execution result judgment
-        execution_success = False
-        if self.expected_pass:
-            execution_success = self.status == TestStatus.PASS
-        else:
-            execution_success = self.status == TestStatus.FAIL
+        expected_status = TestStatus.PASS if self.expected_pass else TestStatus.FAIL
+        if self.status != expected_status:
+            return False
         
-        # Part 2: Log matching result judgment (if required)
-        log_match_success = True  # Default success (if no log matching requirements)
-        if self.log_match_result and self.log_match_result.has_patterns:
-            log_match_success = self.log_match_result.all_matched
+        # Part 2: Log matching result judgment (if required), only once execution is right
+        log_match = self.log_match_result
+        if log_match is not None and log_match.has_patterns:
+            return log_match.all_matched
         
-        # Final success = execution result correct AND log matching success
-        return execution_success and log_match_success
+        # Default success (if no log matching requirements)
+        return True
 
-    @property
+    @cached_property
+    def error_lines(self) -> Tuple[str, ...]:
+        """Error log lines of stdout then stderr, extracted once for every output phase"""
+        stdout_errors = extract_error_logs(self.stdout)
+        stderr_errors = extract_error_logs(self.stderr)
+        return tuple(chain(stdout_errors, stderr_errors)) if stderr_errors else tuple(stdout_errors)
+
+    def release_output(self) -> None:
+        """Keep only the extracted error lines of the captured output and drop the raw text"""
+        _ = self.error_lines  # Extracted and cached while the text is still here
+        self.stdout = ""
+        self.stderr = ""
+
+    @cached_property
     def status_symbol(self) -> str:
         if self.success:
             return "✅"
@@ -346,6 +510,24 @@ class TestResult:
             return "💥"
         else:
             return "❌"
+    
+    @cached_property
+    def outcome_text(self) -> str:
+        """Expected and actual status, as shown in every per-test line and the summary"""
+        return f"Expected: {'PASS' if self.expected_pass else 'FAIL'}, Actual: {self.status.value}"
+    
+    @cached_property
+    def modules_str(self) -> str:
+        """Comma separated name:version list of the test's modules, rendered once"""
+        return ", ".join(f"{m.name}:{m.version}" for m in self.modules) if self.modules else ""
+    
+    @cached_property
+    def summary_line(self) -> str:
+        """Preformatted ALL TEST RESULTS row, rendered once as soon as the test finishes"""
+        modules_info = f" [📦 {self.modules_str}]" if self.modules else ""
+        return _RESULT_LINE_TEMPLATE % (
+            self.status_symbol, self.job_file, "SUCCESS" if self.success else "FAILED",
+            self.outcome_text, self.runtime, modules_info)
 
 
 class TestEnvironment:
@@ -355,9 +537,43 @@ class TestEnvironment:
         self.geodelity_dir = geodelity_dir
         self.debug = debug
         self.keep_job_files = keep_job_files
+        # Script locations are checked once here (and again on validation)
+        # rather than on every test run; None means the script is missing
+        self.env_script_path = self._find_script(ENV_SCRIPT)
+        self.grun_script_path = self._find_script(GRUN_SCRIPT)
+        # Test environment, built once and shared by every test run
+        self._env: Optional[Dict[str, str]] = None
+        # Parallel test runs must not build it (and source env.sh) more than once
+        self._env_lock = threading.Lock()
+    
+    def script_path(self, relative_path: str) -> Path:
+        """Return the expected location of a script under GEODELITY_DIR."""
+        return Path(self.geodelity_dir) / relative_path
+    
+    def _find_script(self, relative_path: str) -> Optional[Path]:
+        """Return the script path if it exists under GEODELITY_DIR, otherwise None."""
+        if not self.geodelity_dir:
+            return None
+        script = self.script_path(relative_path)
+        return script if script.exists() else None
 
-    def setup_environment(self) -> Dict[str, str]:
-        """Setup environment variables for test execution."""
+    def setup_environment(self, cwd: Optional[Path] = None) -> Dict[str, str]:
+        """
+        Setup environment variables for test execution
+        
+        The environment is built on the first call and the same dict is
+        returned afterwards; copy it before making per-job changes. env.sh
+        is sourced in cwd (the tests directory, where the jobs run), so
+        relative paths and $PWD in it resolve as they do for the jobs.
+        """
+        if self._env is None:
+            with self._env_lock:
+                if self._env is None:
+                    self._env = self._build_environment(cwd)
+        return self._env
+    
+    def _build_environment(self, cwd: Optional[Path] = None) -> Dict[str, str]:
+        """Build the test environment, sourcing env.sh when it exists."""
         env = os.environ.copy()
         
         env['GEODELITY_DIR'] = self.geodelity_dir
@@ -373,8 +589,40 @@ class TestEnvironment:
         if self.keep_job_files:
             env['KEEPJOBFILES'] = 'true'
         
+        if self.env_script_path is not None:
+            env = self._source_env_script(env, cwd)
+        
         return env
     
+    def _source_env_script(self, env: Dict[str, str], cwd: Optional[Path] = None) -> Dict[str, str]:
+        """Source env.sh once in a bash shell and return the resulting environment."""
+        # env.sh's own output goes to stderr so that only the env -0 dump is on stdout
+        result = subprocess.run(
+            ['bash', '-c', f'source {shlex.quote(str(self.env_script_path))} >&2 && env -0'],
+            env=env,
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            capture_output=True
+        )
+        if result.returncode != 0:
+            stderr = result.stderr.decode('utf-8', errors='replace').strip()
+            raise RuntimeError(f"Failed to source environment script {self.env_script_path}: {stderr}")
+        
+        script_env = {}
+        for entry in result.stdout.decode('utf-8', errors='replace').split('\0'):
+            name, sep, value = entry.partition('=')
+            if sep:
+                script_env[name] = value
+        
+        # Shell bookkeeping variables belong to the sourcing shell, not to the tests
+        for name in SHELL_STATE_VARS:
+            if name in env:
+                script_env[name] = env[name]
+            else:
+                script_env.pop(name, None)
+        
+        return script_env
+    
     def validate_geodelity_dir(self) -> bool:
         """Validate that GEODELITY_DIR exists and has required scripts."""
         if not self.geodelity_dir:
@@ -385,62 +633,202 @@ class TestEnvironment:
             print(f"Error: GEODELITY_DIR path does not exist: {self.geodelity_dir}")
             return False
         
-        env_script = geodelity_path / "etc" / "env.sh"
-        if not env_script.exists():
-            print(f"Error: Environment script not found: {env_script}")
+        # Scripts may have appeared or moved since the environment was built
+        self._env = None
+        self.env_script_path = self._find_script(ENV_SCRIPT)
+        if self.env_script_path is None:
+            print(f"Error: Environment script not found: {self.script_path(ENV_SCRIPT)}")
             return False
         
-        grun_script = geodelity_path / "bin" / "grun.sh"
-        if not grun_script.exists():
-            print(f"Error: GRun script not found: {grun_script}")
+        self.grun_script_path = self._find_script(GRUN_SCRIPT)
+        if self.grun_script_path is None:
+            print(f"Error: GRun script not found: {self.script_path(GRUN_SCRIPT)}")
             return False
         
         return True
 
 
+@lru_cache(maxsize=512)
+def _plain_scalar_tag(text: str) -> Optional[str]:
+    """
+    Return the tag YAML resolves the plain (unquoted) scalar text to, or None when
+    the safe loader cannot construct it (e.g. '=' or '<<', or 2001-13-45 as a date).
+    """
+    tag = _YAML_RESOLVER.resolve(yaml.ScalarNode, text, (True, False))
+    constructors = _YAML_CONSTRUCTOR.yaml_constructors
+    try:
+        constructors.get(tag, constructors[None])(_YAML_CONSTRUCTOR, yaml.ScalarNode(tag, text))
+    except (yaml.YAMLError, ValueError):
+        return None
+    return tag
+
+
 class JobConfigParser:
     """Parser for job configuration from job files."""
     
+    # Sidecar file in the tests directory keeping parsed configs between runs
+    CACHE_FILE_NAME = '.jobconfig_cache.json'
+    # Bump when parsing changes so configs cached by older versions are ignored
+    CACHE_VERSION = 3
+    
+    # Parsed configs keyed by job file path, with the (mtime_ns, size) they were parsed at
+    _cache: Dict[str, Tuple[Tuple[int, int], JobConfig]] = {}
+    _cache_dirty = False
+    
+    @staticmethod
+    def load_cache(tests_dir: Path, job_files: List[Path]) -> None:
+        """Load configs cached by a previous run for the given job files, if any."""
+        try:
+            with open(tests_dir / JobConfigParser.CACHE_FILE_NAME, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != JobConfigParser.CACHE_VERSION:
+                return
+            paths = {str(job_file) for job_file in job_files}
+            for path, entry in data['entries'].items():
+                if path not in paths:
+                    # Job file deleted or renamed: rewrite the cache without it
+                    JobConfigParser._cache_dirty = True
+                    continue
+                config = entry['config']
+                JobConfigParser._cache[path] = (
+                    (entry['mtime_ns'], entry['size']),
+                    JobConfig(
+                        pass_expected=config['pass_expected'],
+                        timeout=config['timeout'],
+                        log_patterns=tuple(config['log_patterns']),
+                        modules=[ModuleInfo.interned(module['name'], module['version'])
+                                 for module in config['modules']]
+                    )
+                )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Missing or unreadable cache: every job file is simply parsed again
+            pass
+    
+    @staticmethod
+    def save_cache(tests_dir: Path, job_files: List[Path]) -> None:
+        """Persist the configs of the given job files for the next run."""
+        if not JobConfigParser._cache_dirty:
+            return
+        
+        entries = {}
+        for job_file in job_files:
+            path = str(job_file)
+            if path in JobConfigParser._cache:
+                stamp, config = JobConfigParser._cache[path]
+                entries[path] = {'mtime_ns': stamp[0], 'size': stamp[1], 'config': asdict(config)}
+        cache_file = tests_dir / JobConfigParser.CACHE_FILE_NAME
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': JobConfigParser.CACHE_VERSION, 'entries': entries}, f)
+            # Atomic rename, so a concurrent run never reads a half written cache
+            os.replace(temp_file, cache_file)
+            JobConfigParser._cache_dirty = False
+        except OSError:
+            # Read-only tests directory: caching is an optimization only
+            try:
+                os.unlink(temp_file)
+            except OSError:
+                pass
+    
     @staticmethod
     def parse_job_config(job_file: Path) -> JobConfig:
-        """Parse job configuration from the first line of a job file."""
+        """
+        Parse job configuration from the first line of a job file
+        
+        Configs are cached by path and reused while the file's mtime and size
+        are unchanged; JobConfig is frozen so a shared instance cannot be altered.
+        """
+        try:
+            stat = os.stat(job_file)
+        except OSError:
+            return JobConfigParser._parse_job_file(job_file)
+        
+        key = str(job_file)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = JobConfigParser._cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        config = JobConfigParser._parse_job_file(job_file)
+        JobConfigParser._cache[key] = (stamp, config)
+        JobConfigParser._cache_dirty = True
+        return config
+    
+    @staticmethod
+    def _parse_job_file(job_file: Path) -> JobConfig:
+        """Parse the config line and the YAML modules of a job file."""
         config = JobConfig()
         
+        # The file is read once; the config line and the YAML body share that read
+        first_line, yaml_content = JobConfigParser._read_job_file(job_file)
+        
         # Parse first line configuration (existing functionality)
-        try:
-            with open(job_file, 'r', encoding='utf-8') as f:
-                first_line = f.readline().strip()
-                
-            if first_line.startswith('#'):
-                config_text = first_line[1:].strip()
-                if config_text:
-                    config = JobConfig.from_string(config_text)
-        except (IOError, UnicodeDecodeError):
-            pass
+        if first_line.startswith('#'):
+            config_text = first_line[1:].strip()
+            if config_text:
+                config = JobConfig.from_string(config_text)
         
         # Parse YAML content for module information
-        modules = JobConfigParser.parse_yaml_modules(job_file)
-        config.modules = modules
+        if yaml_content is not None:
+            config = replace(config, modules=JobConfigParser._parse_yaml_text(yaml_content))
         
         return config
     
+    @staticmethod
+    def _read_job_file(job_file: Path) -> Tuple[str, Optional[str]]:
+        """
+        Read a job file in a single pass
+        
+        Returns:
+            The stripped first line and the YAML content (without a leading
+            comment line), or None for the YAML content if the whole file
+            cannot be read
+        """
+        try:
+            with open(job_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except UnicodeDecodeError:
+            # An undecodable body must not hide a readable config line
+            try:
+                with open(job_file, 'r', encoding='utf-8') as f:
+                    return f.readline().strip(), None
+            except (IOError, UnicodeDecodeError):
+                return "", None
+        except IOError:
+            return "", None
+        
+        first_line, _, rest = content.partition('\n')
+        first_line = first_line.strip()
+        # Skip first line if it's a comment
+        return first_line, (rest if first_line.startswith('#') else content)
+    
     @staticmethod
     def parse_yaml_modules(job_file: Path) -> List[ModuleInfo]:
         """Parse YAML job file to extract module names and versions."""
-        modules = []
-        
         try:
             with open(job_file, 'r', encoding='utf-8') as f:
-                # Skip first line if it's a comment
                 content = f.read()
-                lines = content.split('\n')
-                if lines and lines[0].strip().startswith('#'):
-                    yaml_content = '\n'.join(lines[1:])
-                else:
-                    yaml_content = content
-                
+        except (IOError, UnicodeDecodeError):
+            return []
+        
+        # Skip first line if it's a comment
+        first_line, _, rest = content.partition('\n')
+        return JobConfigParser._parse_yaml_text(rest if first_line.strip().startswith('#') else content)
+    
+    @staticmethod
+    def _parse_yaml_text(yaml_content: str) -> List[ModuleInfo]:
+        """Extract module names and versions from job file content already read."""
+        modules = []
+        
+        try:
+            # Fast path: scan the fixed schema directly, parse YAML only when needed
+            scanned_modules = JobConfigParser._scan_yaml_modules(yaml_content)
+            if scanned_modules is not None:
+                return scanned_modules
+            
             # Parse YAML content
-            yaml_data = yaml.safe_load(yaml_content)
+            yaml_data = yaml.load(yaml_content, Loader=_YAML_LOADER)
             
             if isinstance(yaml_data, list):
                 for item in yaml_data:
@@ -456,29 +844,181 @@ class JobConfigParser:
                                 elif 'ver' in module_config:
                                     module_version = str(module_config['ver'])
                                 
-                                modules.append(ModuleInfo(
-                                    name=str(module_name),
-                                    version=module_version
-                                ))
+                                modules.append(ModuleInfo.interned(str(module_name), module_version))
                             
-        except (IOError, UnicodeDecodeError, yaml.YAMLError) as e:
+        except yaml.YAMLError as e:
             # If YAML parsing fails, silently continue
             pass
             
         return modules
+    
+    @staticmethod
+    def _scan_yaml_modules(yaml_content: str) -> Optional[List[ModuleInfo]]:
+        """
+        Extract module names and versions with a regex scan of the job file.
+        
+        Returns None when the content does not follow the plain
+        '- module:' / '    version: x' layout, so the caller can fall back
+        to a full YAML parse.
+        """
+        # Anything the scan could read differently from YAML falls back to the parser, so a
+        # file's modules never depend on which path handled it: tabs (not valid indentation),
+        # content outside the module items, a second key in an item, and module names or
+        # versions YAML would not load as a plain str (see _module_versions).
+        if '\t' in yaml_content:
+            return None
+        
+        headers = list(_FAST_MODULE_RE.finditer(yaml_content))
+        if not headers or len(headers) != len(_TOP_LEVEL_ITEM_RE.findall(yaml_content)):
+            return None
+        if _BODY_LINE_RE.search(yaml_content, 0, headers[0].start()):
+            return None
+        
+        modules = []
+        for index, header in enumerate(headers):
+            name = header.group(1)
+            if _plain_scalar_tag(name) != _YAML_RESOLVER.DEFAULT_SCALAR_TAG:
+                return None  # e.g. 'yes' or 'null', which YAML loads as True or None
+            end = headers[index + 1].start() if index + 1 < len(headers) else len(yaml_content)
+            
+            if not _BODY_LINE_RE.search(yaml_content, header.end(), end):
+                # No body: the module maps to null and the YAML path skips it too
+                continue
+            versions = JobConfigParser._module_versions(yaml_content, header.end(), end,
+                                                        header.start(1) - header.start())
+            if versions is None:
+                return None
+            module_version = versions['version'] if 'version' in versions else versions.get('ver', "unknown")
+            modules.append(ModuleInfo.interned(name, module_version))
+        
+        return modules
+    
+    @staticmethod
+    def _module_versions(yaml_content: str, start: int, end: int, key_indent: int) -> Optional[Dict[str, str]]:
+        """
+        Check that a module body is plain block YAML and return its version/ver values
+        
+        Returns None, so that the whole file is parsed as YAML, when the body is not a
+        mapping indented past the module key (a scalar or list body, or a sibling key at
+        the item's key column), when any line needs the real parser (flow collections,
+        anchors, tags, block or escaped scalars, bad indentation, plain values such as
+        '=' or '<<' the loader cannot construct) as such a file may not load at all, or
+        when a version is not a plain str: 1.10 (float), yes (bool), ~ or empty (null),
+        010 (int) and 1:30 (base 60 int) all load as something else.
+        """
+        versions = {}
+        # Indentation and kind (sequence or mapping) of the open block collections
+        stack: List[Tuple[int, bool]] = []
+        opens_block = False  # The previous line may be followed by a deeper block
+        previous_indent = -1
+        
+        for line in _BODY_LINE_RE.finditer(yaml_content, start, end):
+            indent = len(line.group(1))
+            column = line.end(1)
+            is_entry = yaml_content.startswith('-', column) and yaml_content[column + 1:column + 2] in ('', ' ', '\n')
+            
+            if not stack:
+                if indent <= key_indent or is_entry:
+                    return None
+                stack.append((indent, False))
+            elif indent > stack[-1][0]:
+                if not opens_block:
+                    return None
+                stack.append((indent, is_entry))
+            else:
+                while stack and stack[-1][0] > indent:
+                    stack.pop()
+                if not stack or stack[-1][0] != indent:
+                    return None
+                if stack[-1][1] != is_entry:
+                    if is_entry and opens_block and previous_indent == indent:
+                        stack.append((indent, True))  # 'key:' followed by its list at the same indent
+                    elif not is_entry and len(stack) > 1 and stack[-2] == (indent, False):
+                        stack.pop()  # That list has ended, back to the mapping
+                    else:
+                        return None
+            previous_indent = indent
+            
+            if is_entry:
+                column += 1
+                while yaml_content.startswith(' ', column):
+                    column += 1
+                line_end = yaml_content.find('\n', column, end)
+                entry = yaml_content[column:line_end if line_end >= 0 else end].rstrip()
+                if not entry or entry[0] == '#':
+                    opens_block = True
+                    continue
+                if not _KEY_LINE_RE.match(yaml_content, column):
+                    if JobConfigParser._scalar_text(entry) is None:
+                        return None
+                    opens_block = False
+                    continue
+                # '- key: ...' opens a mapping at the key's column
+                stack.append((indent + column - line.end(1), False))
+            
+            key_line = _KEY_LINE_RE.match(yaml_content, column)
+            if key_line is None:
+                return None
+            value = key_line.group(2)
+            opens_block = not value or value[0] == '#'
+            text = None if opens_block else JobConfigParser._scalar_text(value)
+            if not opens_block and text is None:
+                return None
+            
+            if len(stack) == 1 and key_line.group(1) in ('version', 'ver'):
+                if text is None or (value[0] not in '\'"' and
+                                    _plain_scalar_tag(text) != _YAML_RESOLVER.DEFAULT_SCALAR_TAG):
+                    return None
+                # Duplicate keys keep their last value, as in the loaded mapping
+                versions[key_line.group(1)] = text
+        
+        return versions
+    
+    @staticmethod
+    def _scalar_text(value: str) -> Optional[str]:
+        """Return the text of a simple YAML scalar, or None if it needs a real parser."""
+        quote = value[0]
+        if quote in '\'"':
+            closing = value.find(quote, 1)
+            if closing < 0 or (quote == '"' and '\\' in value[1:closing]):
+                return None
+            # Only a comment may follow the closing quote (a doubled quote is an escape)
+            rest = value[closing + 1:]
+            if rest and not (rest[0] == ' ' and rest.lstrip().startswith('#')):
+                return None
+            return value[1:closing]
+        if quote in '&*!|>{}[]%@`#,' or (quote in '-?:' and value[1:2] in ('', ' ')):
+            return None
+        text = value.split(' #', 1)[0].rstrip()
+        if ': ' in text or text.endswith(':') or _plain_scalar_tag(text) is None:
+            return None
+        return text
+
+
+def _decode_output(data: Optional[bytes]) -> str:
+    """Decode captured process output the way text mode would, in a single pass."""
+    if not data:
+        return ""
+    text = data.decode('utf-8', 'replace')
+    # Universal newlines, as text=True would apply while reading
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 
 class SingleTestRunner:
     """Handles running individual test jobs."""
     
-    def __init__(self, test_env: TestEnvironment):
+    def __init__(self, test_env: TestEnvironment, write: Optional[Callable[[str], None]] = None):
         self.test_env = test_env
         self.config_parser = JobConfigParser()
         self.log_matcher = LogPatternMatcher()
+        # Verbose progress goes out in whole blocks so parallel tests do not interleave lines
+        self.write = write or TestOutputFormatter().write
     
     def _print_environment_info(self, env: Dict[str, str]) -> None:
         """Print environment variables information in verbose mode."""
-        print("  📋 Environment variables:")
+        lines = ["  📋 Environment variables:\n"]
         
         # Key environment variables to display
         key_vars = [
@@ -496,46 +1036,43 @@ class SingleTestRunner:
                     display_value = f"...{value[-47:]}"
                 else:
                     display_value = value
-                print(f"    {var}={display_value}")
+                lines.append(f"    {var}={display_value}\n")
         
-        print()
+        lines.append("\n")
+        self.write("".join(lines))
     
     def _perform_log_matching(self, config: JobConfig, stdout: str, stderr: str) -> LogMatchResult:
         """Execute log matching and return results"""
         if config.log_patterns:
+            # Every matching line is collected: the match count is shown in all output modes
             return self.log_matcher.match_patterns(config.log_patterns, stdout, stderr)
         else:
-            return LogMatchResult(
-                patterns=[],
-                matched_patterns=[],
-                unmatched_patterns=[],
-                match_details={}
-            )
+            return LogMatchResult.empty_for()
+    
+    @staticmethod
+    def _run_grun(command: List[str], env: Dict[str, str], cwd: Path,
+                  timeout: int) -> subprocess.CompletedProcess:
+        """Run grun.sh, capturing its output as bytes to be decoded exactly once."""
+        try:
+            return subprocess.run(command, env=env, cwd=cwd, timeout=timeout, capture_output=True)
+        except OSError as e:
+            if e.errno != errno.ENOEXEC:
+                raise
+        # No '#!' line: run it as a bash script, as the shell would when executing it
+        return subprocess.run(['bash'] + command, env=env, cwd=cwd, timeout=timeout, capture_output=True)
     
     def run_test(self, job_file: Path, verbose: bool = False) -> TestResult:
         """Run a single test job file."""
         config = self.config_parser.parse_job_config(job_file)
         
         if verbose:
-            print(f"Running {job_file.name} (timeout: {config.timeout}s, expected: {'pass' if config.pass_expected else 'fail'})")
+            self.write(f"Running {job_file.name} (timeout: {config.timeout}s, expected: {'pass' if config.pass_expected else 'fail'})\n")
         
-        env = self.test_env.setup_environment()
+        env_script = self.test_env.env_script_path
+        grun_script = self.test_env.grun_script_path
         
-        if verbose:
-            self._print_environment_info(env)
-        
-        env_script = f"{self.test_env.geodelity_dir}/etc/env.sh"
-        grun_script = f"{self.test_env.geodelity_dir}/bin/grun.sh"
-        
-        if not Path(env_script).exists():
+        if env_script is None:
             # Error case where environment script doesn't exist
-            log_match_result = LogMatchResult(
-                patterns=config.log_patterns.copy() if config.log_patterns else [],
-                matched_patterns=[],
-                unmatched_patterns=config.log_patterns.copy() if config.log_patterns else [],
-                match_details={}
-            )
-            
             return TestResult(
                 job_file=job_file.name,
                 status=TestStatus.ERROR,
@@ -543,19 +1080,28 @@ class SingleTestRunner:
                 runtime=0.0,
                 timeout_limit=config.timeout,
                 modules=config.modules,
-                error_msg=f"Environment script not found: {env_script}",
-                log_match_result=log_match_result
+                error_msg=f"Environment script not found: {self.test_env.script_path(ENV_SCRIPT)}",
+                log_match_result=LogMatchResult.empty_for(config.log_patterns)
             )
         
-        if not Path(grun_script).exists():
+        if grun_script is None:
             # Error case where GRun script doesn't exist
-            log_match_result = LogMatchResult(
-                patterns=config.log_patterns.copy() if config.log_patterns else [],
-                matched_patterns=[],
-                unmatched_patterns=config.log_patterns.copy() if config.log_patterns else [],
-                match_details={}
+            return TestResult(
+                job_file=job_file.name,
+                status=TestStatus.ERROR,
+                expected_pass=config.pass_expected,
+                runtime=0.0,
+                timeout_limit=config.timeout,
+                modules=config.modules,
+                error_msg=f"GRun script not found: {self.test_env.script_path(GRUN_SCRIPT)}",
+                log_match_result=LogMatchResult.empty_for(config.log_patterns)
             )
-            
+        
+        try:
+            # env.sh is sourced once per run, before the clock starts so that it is not
+            # counted in the first test's runtime; grun.sh is then executed directly
+            env = self.test_env.setup_environment(job_file.parent)
+        except (RuntimeError, OSError) as e:
             return TestResult(
                 job_file=job_file.name,
                 status=TestStatus.ERROR,
@@ -563,28 +1109,24 @@ class SingleTestRunner:
                 runtime=0.0,
                 timeout_limit=config.timeout,
                 modules=config.modules,
-                error_msg=f"GRun script not found: {grun_script}",
-                log_match_result=log_match_result
+                error_msg=str(e),
+                log_match_result=LogMatchResult.empty_for(config.log_patterns)
             )
         
-        command = f'source {shlex.quote(env_script)} && {shlex.quote(grun_script)} {shlex.quote(job_file.name)}'
+        if verbose:
+            self._print_environment_info(env)
         
         start_time = time.time()
         try:
-            result = subprocess.run(
-                ['bash', '-c', command],
-                env=env,
-                cwd=job_file.parent,
-                timeout=config.timeout,
-                capture_output=True,
-                text=True
-            )
+            result = self._run_grun([str(grun_script), job_file.name], env, job_file.parent, config.timeout)
             runtime = time.time() - start_time
             
             status = TestStatus.PASS if result.returncode == 0 else TestStatus.FAIL
+            stdout_str = _decode_output(result.stdout)
+            stderr_str = _decode_output(result.stderr)
             
             # Execute log matching
-            log_match_result = self._perform_log_matching(config, result.stdout, result.stderr)
+            log_match_result = self._perform_log_matching(config, stdout_str, stderr_str)
             
             return TestResult(
                 job_file=job_file.name,
@@ -593,15 +1135,15 @@ class SingleTestRunner:
                 runtime=runtime,
                 timeout_limit=config.timeout,
                 modules=config.modules,
-                stdout=result.stdout,
-                stderr=result.stderr,
+                stdout=stdout_str,
+                stderr=stderr_str,
                 log_match_result=log_match_result
             )
             
         except subprocess.TimeoutExpired as e:
             runtime = time.time() - start_time
-            stdout_str = e.stdout.decode('utf-8') if e.stdout else ""
-            stderr_str = e.stderr.decode('utf-8') if e.stderr else ""
+            stdout_str = _decode_output(e.stdout)
+            stderr_str = _decode_output(e.stderr)
             
             # Even if timeout, try to perform log matching
             log_match_result = self._perform_log_matching(config, stdout_str, stderr_str)
@@ -622,14 +1164,7 @@ class SingleTestRunner:
         except Exception as e:
             runtime = time.time() - start_time
             
-            # Create empty log matching result in exceptional cases
-            log_match_result = LogMatchResult(
-                patterns=config.log_patterns.copy() if config.log_patterns else [],
-                matched_patterns=[],
-                unmatched_patterns=config.log_patterns.copy() if config.log_patterns else [],
-                match_details={}
-            )
-            
+            # Empty log matching result in exceptional cases
             return TestResult(
                 job_file=job_file.name,
                 status=TestStatus.ERROR,
@@ -638,24 +1173,37 @@ class SingleTestRunner:
                 timeout_limit=config.timeout,
                 modules=config.modules,
                 error_msg=str(e),
-                log_match_result=log_match_result
+                log_match_result=LogMatchResult.empty_for(config.log_patterns)
             )
 
 
 class TestRunner:
     """Main test runner that coordinates test execution."""
     
-    def __init__(self, geodelity_dir: str, debug: bool = False, keep_job_files: bool = False):
+    def __init__(self, geodelity_dir: str, debug: bool = False, keep_job_files: bool = False,
+                 jobs: int = 1):
         self.test_env = TestEnvironment(geodelity_dir, debug, keep_job_files)
-        self.single_runner = SingleTestRunner(self.test_env)
         self.output_formatter = TestOutputFormatter()
+        self.single_runner = SingleTestRunner(self.test_env, self.output_formatter.write)
+        # Number of tests run concurrently; 0 picks one per CPU
+        self.jobs = jobs
+        # Running tallies of the last run, kept up to date as results arrive
+        self.success_count = 0
+        self.runtime_total = 0.0
     
     def find_job_files(self, tests_dir: Path) -> List[Path]:
         """Find all job files in the tests directory."""
-        job_files = []
-        for job_file in tests_dir.glob('*.job'):
-            job_files.append(job_file)
-        return sorted(job_files)
+        # DirEntry.is_file() answers from the cached directory entry type, so
+        # regular files need no extra stat() call
+        try:
+            with os.scandir(tests_dir) as entries:
+                names = [entry.name for entry in entries
+                         if entry.name.endswith('.job') and entry.is_file()]
+        except OSError:
+            # Missing, not a directory or unreadable: no job files, as with Path.glob()
+            return []
+        names.sort()
+        return [tests_dir / name for name in names]
     
     def validate_environment(self) -> bool:
         """Validate test environment before running tests."""
@@ -668,229 +1216,361 @@ class TestRunner:
             print(f"No .job files found in {tests_dir}")
             return []
         
+        # Reuse configs parsed by earlier runs for job files that did not change
+        JobConfigParser.load_cache(tests_dir, job_files)
+        
         results = []
         total_tests = len(job_files)
+        self.success_count = 0
+        self.runtime_total = 0.0
         
         if verbose:
             print(f"\nFound {total_tests} test(s) in {tests_dir}")
-            print("=" * 60)
+            print(_SEPARATOR)
         
-        for i, job_file in enumerate(job_files, 1):
-            if not verbose:
-                print(f"[{i}/{total_tests}] {job_file.name}...", end=" ", flush=True)
-            
-            result = self.single_runner.run_test(job_file, verbose)
-            results.append(result)
-            
-            if not verbose:
-                expected_text = "PASS" if result.expected_pass else "FAIL"
-                actual_text = result.status.value
-                print(f"{result.status_symbol} Expected: {expected_text}, Actual: {actual_text} ({result.runtime:.1f}s)")
-                # Show module information
-                self.output_formatter._print_test_modules(result)
-                # Show log pattern matching results in non-verbose mode too
-                self.output_formatter.print_log_match_result(result)
-                # Show error logs in non-verbose mode too
-                self.output_formatter.print_error_logs(result)
-            elif verbose:
-                self.output_formatter.print_test_result(result)
+        workers = self._worker_count(total_tests)
+        if workers > 1:
+            results = self._run_parallel(job_files, verbose, workers)
+        else:
+            for i, job_file in enumerate(job_files, 1):
+                if not verbose:
+                    print(f"[{i}/{total_tests}] {job_file.name}...", end=" ", flush=True)
+                
+                result = self._run_job(job_file, verbose)
+                results.append(result)
+                self._record_result(result)
+                
+                if not verbose:
+                    # Outcome, modules, log pattern matches and error logs in a single write
+                    self.output_formatter.write(self.output_formatter.format_test_summary(result))
+                elif verbose:
+                    self.output_formatter.print_test_result(result)
+        
+        JobConfigParser.save_cache(tests_dir, job_files)
         
         return results
 
+    
+    def _worker_count(self, total_tests: int) -> int:
+        """Number of worker threads to use for total_tests tests."""
+        jobs = self.jobs if self.jobs != 0 else (os.cpu_count() or 1)
+        return max(1, min(jobs, total_tests))
+    
+    def _run_job(self, job_file: Path, verbose: bool) -> TestResult:
+        """Run one test and prepare its output while still on the worker."""
+        result = self.single_runner.run_test(job_file, verbose)
+        # Render the summary row now so the final summary only concatenates
+        _ = result.summary_line
+        if not verbose:
+            # Only verbose output prints the raw logs; finished results need no more than
+            # their error lines, so a run does not hold every test's full output until the end
+            result.release_output()
+        return result
+    
+    def _record_result(self, result: TestResult) -> None:
+        """Add a finished test to the running tallies."""
+        self.success_count += result.success
+        self.runtime_total += result.runtime
+    
+    def _run_parallel(self, job_files: List[Path], verbose: bool, workers: int) -> List[TestResult]:
+        """
+        Run tests on a thread pool; the subprocesses do the work, so the GIL is not a limit
+        
+        Results are reported as they finish and returned in job file order.
+        """
+        total_tests = len(job_files)
+        results: List[Optional[TestResult]] = [None] * total_tests
+        
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = {executor.submit(self._run_job, job_file, verbose): index
+                   for index, job_file in enumerate(job_files)}
+        try:
+            for done, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                result = future.result()
+                results[index] = result
+                self._record_result(result)
+                
+                progress = f"[{done}/{total_tests}] {job_files[index].name}..."
+                if not verbose:
+                    self.output_formatter.write(f"{progress} {self.output_formatter.format_test_summary(result)}")
+                else:
+                    self.output_formatter.write(f"{progress}\n")
+                    self.output_formatter.print_test_result(result)
+        except BaseException:
+            # Ctrl-C or an error: like the sequential loop, start no further tests. Cancelled
+            # by hand since shutdown(cancel_futures=True) needs Python 3.9
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+            raise
+        executor.shutdown()
+        
+        return results
+
+
+def _scan_error_logs(output_text: str) -> Tuple[str, ...]:
+    """Scan output text for error log lines, visiting only lines that contain an error word."""
+    error_lines = []
+    find_hint = _ERROR_HINT_RE.search
+    position = 0
+    
+    # Jump from one candidate line to the next instead of visiting every line
+    while True:
+        hint = find_hint(output_text, position)
+        if hint is None:
+            break
+        start = output_text.rfind('\n', 0, hint.start()) + 1
+        end = output_text.find('\n', hint.end())
+        if end < 0:
+            end = len(output_text)
+        
+        line_stripped = output_text[start:end].strip()
+        # A line is reported once, however many of the patterns it matches
+        if _ERROR_LOG_RE.search(line_stripped):
+            error_lines.append(line_stripped)
+        position = end + 1
+    
+    return tuple(error_lines)
+
+
+def extract_error_logs(output_text: str) -> Tuple[str, ...]:
+    """Extract error log lines from output text, as an immutable tuple that results can share."""
+    # Substring checks settle clean output more cheaply than a regex pass; empty output
+    # lands here too and gets the shared empty result
+    if not any(word in output_text for word in _ERROR_HINT_WORDS):
+        return ()
+    return _scan_error_logs(output_text)
+
 
 class TestOutputFormatter:
     """Handles formatting of test output and results."""
     
+    def __init__(self):
+        self._output_lock = threading.Lock()
+    
     def extract_error_logs(self, output_text: str) -> List[str]:
         """Extract error log lines from output text."""
-        if not output_text:
-            return []
-        
-        error_lines = []
-        # Patterns to match different types of error logs:
-        patterns = [
-            # Pattern 1: HH:MM:SS.microseconds [pid] ERROR message
-            r'\d{2}:\d{2}:\d{2}\.\d+\s+\[\d+\]\s+(ERROR|FATAL|CRITICAL)\s+.*',
-            # Pattern 2: More flexible timestamp with ERROR/FATAL/CRITICAL
-            r'\d{2}:\d{2}:\d{2}[.\d]*\s*\[?\d*\]?\s*(ERROR|FATAL|CRITICAL)\s+.*',
-            # Pattern 3: Simple ERROR/FATAL/CRITICAL at beginning of line
-            r'^(ERROR|FATAL|CRITICAL):\s+.*',
-            # Pattern 4: Lines containing "Error:" or "error:"
-            r'.*[Ee]rror:\s+.*',
-            # Pattern 5: Exception traces
-            r'.*(Exception|Error)\s*:.*',
-            # Pattern 6: Failed/failure messages
-            r'.*(Failed|failed|FAILED)\s+.*'
-        ]
-        
-        for line in output_text.split('\n'):
-            line_stripped = line.strip()
-            if line_stripped:
-                for pattern in patterns:
-                    if re.search(pattern, line_stripped):
-                        error_lines.append(line_stripped)
-                        break  # Don't match same line multiple times
-        
-        return error_lines
+        # A new list on every call, which callers are free to extend
+        return list(extract_error_logs(output_text))
     
-    def print_log_match_result(self, result: TestResult) -> None:
-        """Print log matching results"""
-        if not result.log_match_result or not result.log_match_result.has_patterns:
-            return
-        
+    def write(self, text: str) -> None:
+        """Write a block of output at once so concurrent writers cannot interleave it."""
+        with self._output_lock:
+            stream = sys.stdout
+            buffer = getattr(stream, 'buffer', None)
+            if buffer is None:
+                # Redirected to a plain text stream (e.g. io.StringIO)
+                stream.write(text)
+                stream.flush()
+                return
+            # Encode the whole block once and hand it to the binary layer, flushing
+            # pending text output first so ordering with print() is preserved
+            stream.flush()
+            buffer.write(text.encode(stream.encoding or 'utf-8', stream.errors or 'strict'))
+            buffer.flush()
+    
+    def format_log_match_result(self, result: TestResult) -> str:
+        """Format log matching results"""
         log_match = result.log_match_result
+        if log_match is None or not log_match.has_patterns:
+            return ""
+        
+        lines = []
         
         if log_match.all_matched:
-            print(f"  ✅ Log Pattern Match: All {len(log_match.patterns)} pattern(s) matched")
+            lines.append(f"  ✅ Log Pattern Match: All {len(log_match.patterns)} pattern(s) matched\n")
         else:
-            print(f"  ❌ Log Pattern Match: {len(log_match.matched_patterns)}/{len(log_match.patterns)} pattern(s) matched")
+            lines.append(f"  ❌ Log Pattern Match: {len(log_match.matched_patterns)}/{len(log_match.patterns)} pattern(s) matched\n")
         
         # Display matched patterns
         if log_match.matched_patterns:
-            print(f"    ✅ Matched patterns:")
+            lines.append("    ✅ Matched patterns:\n")
             for pattern in log_match.matched_patterns:
                 matched_lines = log_match.match_details.get(pattern, [])
-                print(f"      • '{pattern}' → found {len(matched_lines)} match(es)")
+                lines.append(f"      • '{pattern}' → found {len(matched_lines)} match(es)\n")
                 # Display first matched example (truncate long lines)
                 if matched_lines:
                     example = matched_lines[0]
                     if len(example) > 80:
                         example = example[:77] + "..."
-                    print(f"        Example: {example}")
+                    lines.append(f"        Example: {example}\n")
         
         # Display unmatched patterns
         if log_match.unmatched_patterns:
-            print(f"    ❌ Unmatched patterns:")
+            lines.append("    ❌ Unmatched patterns:\n")
             for pattern in log_match.unmatched_patterns:
                 pattern_type = "regex" if pattern.startswith('^') else "string"
-                print(f"      • '{pattern}' ({pattern_type})")
+                lines.append(f"      • '{pattern}' ({pattern_type})\n")
         
-        print()
+        lines.append("\n")
+        return "".join(lines)
     
-    def print_error_logs(self, result: TestResult) -> None:
-        """Print extracted error logs separately."""
+    def print_log_match_result(self, result: TestResult) -> None:
+        """Print log matching results"""
+        self.write(self.format_log_match_result(result))
+    
+    def _result_error_logs(self, result: TestResult) -> Sequence[str]:
+        """Error log lines from both stdout and stderr of a test."""
+        return result.error_lines
+    
+    def format_error_logs(self, result: TestResult) -> str:
+        """Format extracted error logs separately."""
         # Extract errors from both stdout and stderr
-        all_errors = []
-        all_errors.extend(self.extract_error_logs(result.stdout))
-        all_errors.extend(self.extract_error_logs(result.stderr))
+        all_errors = self._result_error_logs(result)
+        
+        if not all_errors:
+            return ""
         
-        if all_errors:
-            print(f"  🚨 Error Logs:")
-            for error_line in all_errors:
-                print(f"    {error_line}")
-            print()
+        lines = [_ERROR_LOGS_HEADER]
+        for error_line in all_errors:
+            lines.append(f"    {error_line}\n")
+        lines.append("\n")
+        return "".join(lines)
+    
+    def print_error_logs(self, result: TestResult) -> None:
+        """Print extracted error logs separately."""
+        self.write(self.format_error_logs(result))
+    
+    def format_test_summary(self, result: TestResult) -> str:
+        """Format the outcome line, modules, log matches and error logs of a single test."""
+        return "".join((
+            f"{result.status_symbol} {result.outcome_text} ({result.runtime:.1f}s)\n",
+            self._format_test_modules(result),
+            self.format_log_match_result(result),
+            self.format_error_logs(result),
+        ))
     
     def print_test_result(self, result: TestResult) -> None:
         """Print detailed result for a single test."""
-        expected_text = "PASS" if result.expected_pass else "FAIL"
-        actual_text = result.status.value
-        print(f"  Result: {result.status_symbol} Expected: {expected_text}, Actual: {actual_text} ({result.runtime:.1f}s)")
+        parts = [f"  Result: {result.status_symbol} {result.outcome_text} ({result.runtime:.1f}s)\n"]
         
         # Show module information
-        self._print_test_modules(result)
+        parts.append(self._format_test_modules(result))
         
         # Show log pattern matching results
-        self.print_log_match_result(result)
+        parts.append(self.format_log_match_result(result))
         
         if result.error_msg:
-            print(f"  Error: {result.error_msg}")
+            parts.append(f"  Error: {result.error_msg}\n")
         
         # Show extracted error logs first (most important)
-        self.print_error_logs(result)
-        
-        # Show full stdout output in verbose mode
-        if result.stdout and len(result.stdout.strip()) > 0:
-            print(f"  📤 Stdout:")
-            # Indent each line of stdout for better readability
-            for line in result.stdout.strip().split('\n'):
-                print(f"    {line}")
-        
-        # Show full stderr output in verbose mode
-        if result.stderr and len(result.stderr.strip()) > 0:
-            print(f"  📥 Stderr:")
-            # Indent each line of stderr for better readability
-            for line in result.stderr.strip().split('\n'):
-                print(f"    {line}")
-        
-        print()
+        parts.append(self.format_error_logs(result))
+        
+        # Show full stdout output in verbose mode, each line indented for readability
+        stdout_block = self._indent_output(result.stdout)
+        if stdout_block:
+            parts.append(_STDOUT_HEADER)
+            parts.append(stdout_block)
+        
+        # Show full stderr output in verbose mode, each line indented for readability
+        stderr_block = self._indent_output(result.stderr)
+        if stderr_block:
+            parts.append(_STDERR_HEADER)
+            parts.append(stderr_block)
+        
+        parts.append("\n")
+        self.write("".join(parts))
+    
+    @staticmethod
+    def _indent_output(output: str) -> str:
+        """Indent each line of captured output, dropping blank leading and trailing lines."""
+        lines = output.splitlines()
+        start, end = 0, len(lines)
+        while start < end and not lines[start].strip():
+            start += 1
+        while end > start and not lines[end - 1].strip():
+            end -= 1
+        if start == end:
+            return ""
+        return "    " + "\n    ".join(lines[start:end]) + "\n"
+    
+    def _format_test_modules(self, result: TestResult) -> str:
+        """Format module information for a single test."""
+        if not result.modules:
+            return ""
+        return _MODULES_PREFIX + result.modules_str + "\n"
     
     def _print_test_modules(self, result: TestResult) -> None:
         """Print module information for a single test."""
-        if result.modules:
-            modules_info = []
-            for module in result.modules:
-                modules_info.append(f"{module.name}:{module.version}")
-            modules_str = ", ".join(modules_info)
-            print(f"  📦 Modules: {modules_str}")
-    
-    def print_test_summary(self, results: List[TestResult], verbose: bool = False) -> None:
-        """Print summary of all test results."""
+        self.write(self._format_test_modules(result))
+    
+    def print_test_summary(self, results: List[TestResult], verbose: bool = False,
+                           successful: Optional[int] = None,
+                           total_runtime: Optional[float] = None) -> None:
+        """Print summary of all test results.
+        
+        successful and total_runtime may be passed in when the caller already
+        tallied them while the tests ran (see TestRunner.success_count).
+        """
         if not results:
             return
         
-        total = len(results)
-        successful = sum(1 for r in results if r.success)
-        failed = total - successful
-        
-        total_runtime = sum(r.runtime for r in results)
+        if successful is not None and total_runtime is not None:
+            failed_results = [result for result in results if not result.success]
+        else:
+            successful = 0
+            total_runtime = 0.0
+            failed_results = []
+            
+            # Single pass over the results counts them and collects the failed ones
+            for result in results:
+                success = result.success
+                successful += success  # bool counts as 0/1, no branch needed
+                total_runtime += result.runtime
+                if not success:
+                    failed_results.append(result)
+        
+        failed = len(failed_results)
+        total = successful + failed
+        success_rate = successful / total * 100 if total else 0.0
+        
+        # Failure details only need to look at the failed tests
+        failed_lines = []
+        failed_test_error_logs = []
+        for result in failed_results:
+            reason = result.outcome_text
+            
+            # Add log matching failure information
+            log_match = result.log_match_result
+            if log_match is not None and log_match.has_patterns and not log_match.all_matched:
+                unmatched_count = len(log_match.unmatched_patterns)
+                total_patterns = len(log_match.patterns)
+                reason += f" - Log match failed: {unmatched_count}/{total_patterns} patterns unmatched"
+            
+            if result.error_msg:
+                reason += f" - {result.error_msg}"
+            failed_lines.append(f"  {result.status_symbol} {result.job_file}: {reason} ({result.runtime:.1f}s)\n")
+            
+            # Show error logs summary for failed tests only
+            errors = self._result_error_logs(result)
+            failed_test_error_logs.extend((result.job_file, error) for error in errors)
         
-        print("\n" + "=" * 60)
-        print("TEST SUMMARY")
-        print("=" * 60)
+        # Stream the whole summary into one buffer and emit it with a single write
+        buf = io.StringIO()
+        w = buf.write
+        w(_SUMMARY_HEADER)
         
-        print(f"Total tests: {total}")
-        print(f"Successful:  {successful} ✅")
-        print(f"Failed:      {failed} ❌")
-        print(f"Success rate: {successful/total*100:.1f}%")
-        print(f"Total runtime: {total_runtime:.1f}s")
+        w(f"Total tests: {total}\n")
+        w(f"Successful:  {successful} ✅\n")
+        w(f"Failed:      {failed} ❌\n")
+        w(f"Success rate: {success_rate:.1f}%\n")
+        w(f"Total runtime: {total_runtime:.1f}s\n")
         
-        if failed > 0:
-            print(f"\nFAILED TESTS:")
-            for result in results:
-                if not result.success:
-                    expected_text = "PASS" if result.expected_pass else "FAIL"
-                    actual_text = result.status.value
-                    reason = f"Expected: {expected_text}, Actual: {actual_text}"
-                    
-                    # Add log matching failure information
-                    if result.log_match_result and result.log_match_result.has_patterns and not result.log_match_result.all_matched:
-                        unmatched_count = len(result.log_match_result.unmatched_patterns)
-                        total_patterns = len(result.log_match_result.patterns)
-                        reason += f" - Log match failed: {unmatched_count}/{total_patterns} patterns unmatched"
-                    
-                    if result.error_msg:
-                        reason += f" - {result.error_msg}"
-                    print(f"  {result.status_symbol} {result.job_file}: {reason} ({result.runtime:.1f}s)")
-        
-        # Show error logs summary for failed tests only
-        failed_test_error_logs = []
-        for result in results:
-            if not result.success:  # Only collect errors from failed tests
-                errors = self.extract_error_logs(result.stdout)
-                errors.extend(self.extract_error_logs(result.stderr))
-                if errors:
-                    failed_test_error_logs.extend([(result.job_file, error) for error in errors])
+        if failed_lines:
+            w("\nFAILED TESTS:\n")
+            buf.writelines(failed_lines)
         
         if failed_test_error_logs:
-            print(f"\n🚨 ERROR LOGS FROM FAILED TESTS ({len(failed_test_error_logs)} total):")
+            w(_ERROR_BANNER + str(len(failed_test_error_logs)) + " total):\n")
             for job_file, error_line in failed_test_error_logs:
-                print(f"  [{job_file}] {error_line}")
+                w(f"  [{job_file}] {error_line}\n")
         
-        if results:
-            print(f"\nALL TEST RESULTS:")
-            for result in results:
-                expected_text = "PASS" if result.expected_pass else "FAIL"
-                actual_text = result.status.value
-                status_text = "SUCCESS" if result.success else "FAILED"
-                
-                # Build modules info string
-                modules_info = ""
-                if result.modules:
-                    modules_list = [f"{m.name}:{m.version}" for m in result.modules]
-                    modules_str = ", ".join(modules_list)
-                    modules_info = f" [📦 {modules_str}]"
-                
-                print(f"  {result.status_symbol} {result.job_file}: {status_text} - Expected: {expected_text}, Actual: {actual_text} ({result.runtime:.1f}s){modules_info}")
+        w("\nALL TEST RESULTS:\n")
+        # Rows were preformatted per result; the summary only concatenates them
+        buf.writelines(result.summary_line for result in results)
+        
+        self.write(buf.getvalue())
 
 def validate_geodelity_dir(geodelity_dir: str) -> bool:
     """Backward compatibility function for validating GEODELITY_DIR."""